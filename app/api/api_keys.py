@@ -31,8 +31,7 @@ def get_api_keys():
             FROM api_keys
             ORDER BY priority ASC, created_at ASC
         """)
-        rows = cursor.fetchall()
-        api_keys = [ApiKey.from_row(row).to_dict(mask_key=True) for row in rows]
+        api_keys = [ApiKey.from_row(row).to_dict(mask_key=True) for row in cursor]
         return {"api_keys": api_keys}
 
 
@@ -206,11 +205,12 @@ def get_active_api_key():
         api_key_obj = ApiKey.from_row(row)
 
         # last_used_at 업데이트
+        now = datetime.now().isoformat()
         cursor.execute("""
             UPDATE api_keys
             SET last_used_at = ?, updated_at = ?
             WHERE id = ?
-        """, (datetime.now().isoformat(), datetime.now().isoformat(), api_key_obj.id))
+        """, (now, now, api_key_obj.id))
         conn.commit()
 
         # 실제 API 키 반환 (마스킹 안함)
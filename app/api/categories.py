@@ -26,13 +26,10 @@ def get_categories():
     with get_db() as conn:
         cursor = conn.cursor()
 
-        # 전체 채널 개수
-        cursor.execute("SELECT COUNT(*) FROM channels")
-        total_count = cursor.fetchone()[0]
-
-        # 각 카테고리별 채널 개수 포함 (display_order로 정렬)
+        # 각 카테고리별 채널 개수와 전체 채널 개수를 한 번에 조회 (display_order로 정렬)
         cursor.execute("""
-            SELECT c.id, c.name, c.created_at, c.display_order, COUNT(ch.id) as channel_count
+            SELECT c.id, c.name, c.created_at, c.display_order, COUNT(ch.id) as channel_count,
+                   (SELECT COUNT(*) FROM channels) as total_count
             FROM categories c
             LEFT JOIN channels ch ON c.id = ch.category_id
             GROUP BY c.id, c.name, c.created_at, c.display_order
@@ -40,6 +37,13 @@ def get_categories():
         """)
         rows = cursor.fetchall()
 
+        # 전체 채널 개수
+        if rows:
+            total_count = rows[0][5]
+        else:
+            cursor.execute("SELECT COUNT(*) FROM channels")
+            total_count = cursor.fetchone()[0]
+
         categories = []
         needs_order_init = False
 
@@ -62,12 +66,12 @@ def get_categories():
             # 모든 display_order가 0이면 ID 순서대로 display_order 부여
             all_zero = all(c["display_order"] == 0 for c in categories)
             if all_zero:
+                cursor.executemany("""
+                    UPDATE categories
+                    SET display_order = ?
+                    WHERE id = ?
+                """, [(idx, category["id"]) for idx, category in enumerate(categories)])
                 for idx, category in enumerate(categories):
-                    cursor.execute("""
-                        UPDATE categories
-                        SET display_order = ?
-                        WHERE id = ?
-                    """, (idx, category["id"]))
                     category["display_order"] = idx
                 conn.commit()
 
@@ -254,17 +258,11 @@ def reorder_category(category_id: int, direction: str):
         target_id, target_order = target[0], target[1]
 
         # 순서 교환
-        cursor.execute("""
-            UPDATE categories
-            SET display_order = ?
-            WHERE id = ?
-        """, (target_order, current_id))
-
-        cursor.execute("""
+        cursor.executemany("""
             UPDATE categories
             SET display_order = ?
             WHERE id = ?
-        """, (current_order, target_id))
+        """, [(target_order, current_id), (current_order, target_id)])
 
         conn.commit()
 
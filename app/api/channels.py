@@ -3,12 +3,21 @@ from pydantic import BaseModel
 from datetime import datetime
 from typing import List, Optional
 import re
+from concurrent.futures import ThreadPoolExecutor
 from ..db import get_db
 from ..models import Channel
 from .youtube import YouTubeAPI, QuotaExceededException
 
 router = APIRouter(prefix="/api/channels", tags=["channels"])
 
+# 채널 정보 조회 YouTube API 동시 호출 수
+RESOLVE_MAX_WORKERS = 8
+
+# Markdown에서 채널 URL 추출 (/channel/, /@, /c/, /user/ 형식)
+CHANNEL_URL_RE = re.compile(
+    r'https?://(?:www\.)?youtube\.com/(?:channel/|@|c/|user/)[a-zA-Z0-9_-]+'
+)
+
 
 class BulkUpsertRequest(BaseModel):
     category_id: int
@@ -53,6 +62,177 @@ def mark_api_key_quota_exceeded(api_key: str):
         conn.commit()
 
 
+def _resolve_channels(
+    youtube_api: YouTubeAPI,
+    api_key: str,
+    channel_inputs: List[str],
+    errors: List[dict]
+) -> List[tuple]:
+    """
+    채널 입력 목록을 (입력, channelId, 채널 정보) 목록으로 변환
+
+    1. 입력별 channelId 정규화 (병렬 호출)
+    2. 채널 정보 일괄 조회 (50개씩 묶어서 요청)
+    실패한 입력은 errors에 추가 (쿼터 초과 시에도 이미 조회한 채널은 반환)
+    """
+    with ThreadPoolExecutor(max_workers=RESOLVE_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(youtube_api.normalize_channel_input, channel_input)
+            for channel_input in channel_inputs
+        ]
+
+    # 입력 순서대로 결과 정리
+    resolved = []
+    quota_exceeded = False
+    for channel_input, future in zip(channel_inputs, futures):
+        try:
+            channel_id = future.result()
+            if not channel_id:
+                errors.append({
+                    "input": channel_input,
+                    "error": "채널 ID를 찾을 수 없습니다"
+                })
+                continue
+
+            resolved.append((channel_input, channel_id))
+
+        except QuotaExceededException as e:
+            # 쿼터 초과 입력만 실패로 기록하고 나머지 결과는 계속 정리
+            quota_exceeded = True
+            errors.append({
+                "input": channel_input,
+                "error": f"API 쿼터가 초과되었습니다: {str(e)}"
+            })
+        except Exception as e:
+            errors.append({
+                "input": channel_input,
+                "error": str(e)
+            })
+
+    # 채널 정보 일괄 조회 (쿼터 초과 후에는 요청하지 않음)
+    channel_infos = {}
+    unprocessed_ids = set()
+    if quota_exceeded:
+        unprocessed_ids = {channel_id for _, channel_id in resolved}
+    elif resolved:
+        channel_infos, unprocessed = youtube_api.get_channels_info(
+            [channel_id for _, channel_id in resolved]
+        )
+        unprocessed_ids = set(unprocessed)
+
+    # API 키 쿼터 초과 처리
+    if quota_exceeded or unprocessed_ids:
+        mark_api_key_quota_exceeded(api_key)
+
+    # 조회된 채널은 저장 대상으로, 나머지는 입력별로 실패 기록
+    fetched = []
+    for channel_input, channel_id in resolved:
+        channel_info = channel_infos.get(channel_id)
+        if channel_info:
+            fetched.append((channel_input, channel_id, channel_info))
+        elif channel_id in unprocessed_ids:
+            errors.append({
+                "input": channel_input,
+                "error": "API 쿼터가 초과되어 처리하지 못했습니다"
+            })
+        else:
+            errors.append({
+                "input": channel_input,
+                "error": "채널 정보를 가져올 수 없습니다"
+            })
+
+    return fetched
+
+
+def _upsert_channels(
+    category_id: int,
+    fetched: List[tuple],
+    results: List[dict],
+    errors: List[dict]
+):
+    """
+    (입력, channelId, 채널 정보) 목록을 카테고리에 upsert (단일 트랜잭션)
+
+    없으면 INSERT, 있으면 UPDATE. 결과는 results/errors에 추가
+    """
+    # 저장할 채널이 없으면 DB 작업 생략
+    if not fetched:
+        return
+
+    now = datetime.now().isoformat()
+
+    with get_db() as conn:
+        cursor = conn.cursor()
+
+        # 기존 채널 일괄 확인
+        fetched_ids = [channel_id for _, channel_id, _ in fetched]
+        placeholders = ",".join(["?" for _ in fetched_ids])
+        cursor.execute(f"""
+            SELECT channel_id FROM channels
+            WHERE category_id = ? AND channel_id IN ({placeholders})
+        """, (category_id, *fetched_ids))
+        existing_ids = {row[0] for row in cursor}
+
+        for channel_input, channel_id, channel_info in fetched:
+            try:
+                if channel_id in existing_ids:
+                    # UPDATE
+                    cursor.execute("""
+                        UPDATE channels
+                        SET title = ?,
+                            description = ?,
+                            subscriber_count = ?,
+                            country = ?,
+                            updated_at = ?
+                        WHERE category_id = ? AND channel_id = ?
+                    """, (
+                        channel_info["title"],
+                        channel_info.get("description"),
+                        channel_info["subscriber_count"],
+                        channel_info.get("country"),
+                        now,
+                        category_id,
+                        channel_id
+                    ))
+                    action = "updated"
+                else:
+                    # INSERT
+                    cursor.execute("""
+                        INSERT INTO channels (
+                            category_id, channel_input, channel_id, title,
+                            description, subscriber_count, country, is_active,
+                            created_at, updated_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+                    """, (
+                        category_id,
+                        channel_input,
+                        channel_id,
+                        channel_info["title"],
+                        channel_info.get("description"),
+                        channel_info["subscriber_count"],
+                        channel_info.get("country"),
+                        now,
+                        now
+                    ))
+                    existing_ids.add(channel_id)
+                    action = "created"
+
+                results.append({
+                    "input": channel_input,
+                    "channel_id": channel_id,
+                    "title": channel_info["title"],
+                    "action": action
+                })
+
+            except Exception as e:
+                errors.append({
+                    "input": channel_input,
+                    "error": str(e)
+                })
+
+        conn.commit()
+
+
 @router.get("/")
 def get_channels(category_id: Optional[int] = None):
     """채널 목록 조회"""
@@ -79,10 +259,8 @@ def get_channels(category_id: Optional[int] = None):
                 LEFT JOIN categories cat ON c.category_id = cat.id
                 ORDER BY c.created_at DESC
             """)
-        rows = cursor.fetchall()
-
         channels = []
-        for row in rows:
+        for row in cursor:
             channel_dict = {
                 "id": row[0],
                 "category_id": row[1],
@@ -121,105 +299,13 @@ def bulk_upsert_channels(data: BulkUpsertRequest):
     results = []
     errors = []
 
-    for channel_input in data.channel_inputs:
-        channel_input = channel_input.strip()
-        if not channel_input:
-            continue
-
-        try:
-            # 1. channelId 정규화
-            channel_id = youtube_api.normalize_channel_input(channel_input)
-            if not channel_id:
-                errors.append({
-                    "input": channel_input,
-                    "error": "채널 ID를 찾을 수 없습니다"
-                })
-                continue
-
-            # 2. 채널 정보 가져오기
-            channel_info = youtube_api.get_channel_info(channel_id)
-            if not channel_info:
-                errors.append({
-                    "input": channel_input,
-                    "error": "채널 정보를 가져올 수 없습니다"
-                })
-                continue
-
-            # 3. DB에 upsert
-            with get_db() as conn:
-                cursor = conn.cursor()
-                now = datetime.now().isoformat()
-
-                # 기존 채널 확인
-                cursor.execute("""
-                    SELECT id FROM channels
-                    WHERE category_id = ? AND channel_id = ?
-                """, (data.category_id, channel_id))
-                existing = cursor.fetchone()
-
-                if existing:
-                    # UPDATE
-                    cursor.execute("""
-                        UPDATE channels
-                        SET title = ?,
-                            description = ?,
-                            subscriber_count = ?,
-                            country = ?,
-                            updated_at = ?
-                        WHERE category_id = ? AND channel_id = ?
-                    """, (
-                        channel_info["title"],
-                        channel_info.get("description"),
-                        channel_info["subscriber_count"],
-                        channel_info.get("country"),
-                        now,
-                        data.category_id,
-                        channel_id
-                    ))
-                    action = "updated"
-                else:
-                    # INSERT
-                    cursor.execute("""
-                        INSERT INTO channels (
-                            category_id, channel_input, channel_id, title,
-                            description, subscriber_count, country, is_active,
-                            created_at, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                    """, (
-                        data.category_id,
-                        channel_input,
-                        channel_id,
-                        channel_info["title"],
-                        channel_info.get("description"),
-                        channel_info["subscriber_count"],
-                        channel_info.get("country"),
-                        now,
-                        now
-                    ))
-                    action = "created"
-
-                conn.commit()
+    channel_inputs = [ci.strip() for ci in data.channel_inputs if ci.strip()]
 
-                results.append({
-                    "input": channel_input,
-                    "channel_id": channel_id,
-                    "title": channel_info["title"],
-                    "action": action
-                })
+    # 1~2. API로 channelId 정규화 및 채널 정보 가져오기
+    fetched = _resolve_channels(youtube_api, api_key, channel_inputs, errors)
 
-        except QuotaExceededException as e:
-            # API 키 쿼터 초과 처리
-            mark_api_key_quota_exceeded(api_key)
-            errors.append({
-                "input": channel_input,
-                "error": f"API 쿼터가 초과되었습니다: {str(e)}"
-            })
-            break  # 쿼터 초과 시 더 이상 진행하지 않음
-        except Exception as e:
-            errors.append({
-                "input": channel_input,
-                "error": str(e)
-            })
+    # 3. DB에 upsert (단일 트랜잭션)
+    _upsert_channels(data.category_id, fetched, results, errors)
 
     return {
         "success": len(results),
@@ -326,16 +412,14 @@ def bulk_move_channels(data: BulkMoveChannelsRequest):
         if not cursor.fetchone():
             raise HTTPException(status_code=404, detail="카테고리를 찾을 수 없습니다")
 
-        # 각 채널 이동
-        moved_count = 0
-        for channel_id in data.channel_ids:
-            cursor.execute("""
-                UPDATE channels
-                SET category_id = ?, updated_at = ?
-                WHERE id = ?
-            """, (data.new_category_id, datetime.now().isoformat(), channel_id))
-            if cursor.rowcount > 0:
-                moved_count += 1
+        # 채널 일괄 이동
+        now = datetime.now().isoformat()
+        cursor.executemany("""
+            UPDATE channels
+            SET category_id = ?, updated_at = ?
+            WHERE id = ?
+        """, [(data.new_category_id, now, channel_id) for channel_id in data.channel_ids])
+        moved_count = max(cursor.rowcount, 0)
 
         conn.commit()
 
@@ -354,14 +438,21 @@ class BulkDeleteChannelsRequest(BaseModel):
 @router.delete("/bulk/delete")
 def bulk_delete_channels(data: BulkDeleteChannelsRequest):
     """여러 채널을 한번에 삭제"""
+    if not data.channel_ids:
+        return {
+            "success": True,
+            "deleted_count": 0,
+            "total_requested": 0
+        }
+
     with get_db() as conn:
         cursor = conn.cursor()
 
-        deleted_count = 0
-        for channel_id in data.channel_ids:
-            cursor.execute("DELETE FROM channels WHERE id = ?", (channel_id,))
-            if cursor.rowcount > 0:
-                deleted_count += 1
+        cursor.executemany(
+            "DELETE FROM channels WHERE id = ?",
+            [(channel_id,) for channel_id in data.channel_ids]
+        )
+        deleted_count = max(cursor.rowcount, 0)
 
         conn.commit()
 
@@ -451,19 +542,8 @@ async def upload_md_file(
     content = await file.read()
     text = content.decode('utf-8')
 
-    # YouTube URL 패턴 매칭
-    patterns = [
-        r'https?://(?:www\.)?youtube\.com/channel/([a-zA-Z0-9_-]+)',
-        r'https?://(?:www\.)?youtube\.com/@([a-zA-Z0-9_-]+)',
-        r'https?://(?:www\.)?youtube\.com/c/([a-zA-Z0-9_-]+)',
-        r'https?://(?:www\.)?youtube\.com/user/([a-zA-Z0-9_-]+)',
-    ]
-
-    urls = set()
-    for pattern in patterns:
-        matches = re.finditer(pattern, text)
-        for match in matches:
-            urls.add(match.group(0))
+    # YouTube URL 패턴 매칭 (한 번의 스캔으로 모든 형식 추출)
+    urls = {match.group(0) for match in CHANNEL_URL_RE.finditer(text)}
 
     if not urls:
         raise HTTPException(status_code=400, detail="파일에서 YouTube URL을 찾을 수 없습니다")
@@ -475,100 +555,11 @@ async def upload_md_file(
     results = []
     errors = []
 
-    for url in urls:
-        try:
-            # URL을 channelId로 정규화
-            channel_id = youtube_api.normalize_channel_input(url)
-            if not channel_id:
-                errors.append({
-                    "input": url,
-                    "error": "채널 ID를 찾을 수 없습니다"
-                })
-                continue
+    # 1~2. API로 channelId 정규화 및 채널 정보 가져오기
+    fetched = _resolve_channels(youtube_api, api_key, list(urls), errors)
 
-            # 채널 정보 가져오기
-            channel_info = youtube_api.get_channel_info(channel_id)
-            if not channel_info:
-                errors.append({
-                    "input": url,
-                    "error": "채널 정보를 가져올 수 없습니다"
-                })
-                continue
-
-            # DB에 upsert
-            with get_db() as conn:
-                cursor = conn.cursor()
-                now = datetime.now().isoformat()
-
-                # 기존 채널 확인
-                cursor.execute("""
-                    SELECT id FROM channels
-                    WHERE category_id = ? AND channel_id = ?
-                """, (category_id, channel_id))
-                existing = cursor.fetchone()
-
-                if existing:
-                    # UPDATE
-                    cursor.execute("""
-                        UPDATE channels
-                        SET title = ?,
-                            description = ?,
-                            subscriber_count = ?,
-                            country = ?,
-                            updated_at = ?
-                        WHERE category_id = ? AND channel_id = ?
-                    """, (
-                        channel_info["title"],
-                        channel_info.get("description"),
-                        channel_info["subscriber_count"],
-                        channel_info.get("country"),
-                        now,
-                        category_id,
-                        channel_id
-                    ))
-                    action = "updated"
-                else:
-                    # INSERT
-                    cursor.execute("""
-                        INSERT INTO channels (
-                            category_id, channel_input, channel_id, title,
-                            description, subscriber_count, country, is_active,
-                            created_at, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
-                    """, (
-                        category_id,
-                        url,
-                        channel_id,
-                        channel_info["title"],
-                        channel_info.get("description"),
-                        channel_info["subscriber_count"],
-                        channel_info.get("country"),
-                        now,
-                        now
-                    ))
-                    action = "created"
-
-                conn.commit()
-
-                results.append({
-                    "input": url,
-                    "channel_id": channel_id,
-                    "title": channel_info["title"],
-                    "action": action
-                })
-
-        except QuotaExceededException as e:
-            mark_api_key_quota_exceeded(api_key)
-            errors.append({
-                "input": url,
-                "error": f"API 쿼터가 초과되었습니다: {str(e)}"
-            })
-            break
-        except Exception as e:
-            errors.append({
-                "input": url,
-                "error": str(e)
-            })
+    # 3. DB에 upsert (단일 트랜잭션)
+    _upsert_channels(category_id, fetched, results, errors)
 
     return {
         "success": len(results),
@@ -1,23 +1,27 @@
 import os
+import json
 import subprocess
 from typing import Optional, Dict
 from datetime import datetime
 from pathlib import Path
 
 
+# 파일명에 쓸 수 없는 문자 -> "_" 변환 테이블 (한 번의 순회로 치환)
+INVALID_FILENAME_TABLE = str.maketrans({char: "_" for char in '<>:"/\\|?*'})
+
+
 class VideoDownloader:
     """yt-dlp를 사용한 비디오 다운로더"""
 
     def __init__(self, download_dir: str = "downloads"):
         self.download_dir = download_dir
         Path(download_dir).mkdir(parents=True, exist_ok=True)
+        # yt-dlp 설치 확인 결과 (설치된 경우만 보관, 미설치면 매번 재확인)
+        self._yt_dlp_installed = False
 
     def _sanitize_filename(self, filename: str) -> str:
         """파일명에서 특수문자 제거"""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, "_")
-        return filename
+        return filename.translate(INVALID_FILENAME_TABLE)
 
     def download_video(
         self,
@@ -63,10 +67,11 @@ class VideoDownloader:
                 f"https://www.youtube.com/watch?v={video_id}"
             ]
 
-            # 실행
+            # 실행 (진행률 출력은 버리고 에러 메시지만 수집)
             result = subprocess.run(
                 command,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=300  # 5분 타임아웃
             )
@@ -99,13 +104,17 @@ class VideoDownloader:
 
     def check_yt_dlp_installed(self) -> bool:
         """yt-dlp 설치 여부 확인"""
+        if self._yt_dlp_installed:
+            return True
+
         try:
             result = subprocess.run(
                 ["yt-dlp", "--version"],
                 capture_output=True,
                 timeout=5
             )
-            return result.returncode == 0
+            self._yt_dlp_installed = result.returncode == 0
+            return self._yt_dlp_installed
         except Exception:
             return False
 
@@ -126,7 +135,6 @@ class VideoDownloader:
             )
 
             if result.returncode == 0:
-                import json
                 return json.loads(result.stdout)
             return None
 
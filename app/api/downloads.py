@@ -3,6 +3,8 @@ from fastapi.responses import FileResponse
 from pydantic import BaseModel
 from datetime import datetime
 from typing import List
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import os
 from ..db import get_db
 from ..models import Download
@@ -13,17 +15,86 @@ router = APIRouter(prefix="/api/downloads", tags=["downloads"])
 # 다운로더 인스턴스
 downloader = VideoDownloader(download_dir="downloads")
 
+# 동시 다운로드 수
+DOWNLOAD_MAX_WORKERS = 3
+
 
 class DownloadStartRequest(BaseModel):
     video_ids: List[str]
 
 
+def _download_one(video_id: str, video_row) -> dict:
+    """단일 영상 다운로드 및 downloads 테이블 기록"""
+    if not video_row:
+        return {
+            "video_id": video_id,
+            "status": "failed",
+            "error": "영상 정보를 찾을 수 없습니다"
+        }
+
+    video_id_db = video_row[0]
+    video_title = video_row[1]
+    channel_title = video_row[2]
+
+    # downloads 테이블에 기록
+    with get_db() as conn:
+        cursor = conn.cursor()
+        now = datetime.now().isoformat()
+
+        # 다운로드 상태 초기화
+        cursor.execute("""
+            INSERT INTO downloads (video_id, status, created_at, updated_at)
+            VALUES (?, 'running', ?, ?)
+        """, (video_id, now, now))
+        download_id = cursor.lastrowid
+        conn.commit()
+
+    # 실제 다운로드 수행
+    result = downloader.download_video(video_id, channel_title)
+
+    # 결과 업데이트
+    with get_db() as conn:
+        cursor = conn.cursor()
+        now = datetime.now().isoformat()
+
+        if result["success"]:
+            cursor.execute("""
+                UPDATE downloads
+                SET status = 'done',
+                    file_path = ?,
+                    updated_at = ?
+                WHERE id = ?
+            """, (result["file_path"], now, download_id))
+            status = "done"
+            error = None
+        else:
+            cursor.execute("""
+                UPDATE downloads
+                SET status = 'failed',
+                    error_message = ?,
+                    updated_at = ?
+                WHERE id = ?
+            """, (result["error_message"], now, download_id))
+            status = "failed"
+            error = result["error_message"]
+
+        conn.commit()
+
+    return {
+        "video_id": video_id,
+        "video_title": video_title,
+        "status": status,
+        "file_path": result.get("file_path"),
+        "error": error
+    }
+
+
 @router.post("/start")
 def start_downloads(data: DownloadStartRequest):
     """
     선택한 영상들 다운로드 시작
 
-    간단 구현: 순차적으로 다운로드하고 결과 반환
+    영상별로 병렬 다운로드하고 결과 반환
     """
     if not data.video_ids:
         raise HTTPException(status_code=400, detail="다운로드할 영상이 없습니다")
@@ -35,91 +106,39 @@ def start_downloads(data: DownloadStartRequest):
             detail="yt-dlp가 설치되어 있지 않습니다. 'pip install yt-dlp' 또는 'brew install yt-dlp'로 설치하세요."
         )
 
-    results = []
-
-    for video_id in data.video_ids:
-        # 영상 정보 조회 (채널명 가져오기)
-        with get_db() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT v.video_id, v.title, c.title as channel_title
-                FROM videos v
-                LEFT JOIN channels c ON v.channel_id = c.channel_id
-                WHERE v.video_id = ?
-            """, (video_id,))
-            video_row = cursor.fetchone()
-
-        if not video_row:
-            results.append({
-                "video_id": video_id,
-                "status": "failed",
-                "error": "영상 정보를 찾을 수 없습니다"
-            })
-            continue
-
-        video_id_db = video_row[0]
-        video_title = video_row[1]
-        channel_title = video_row[2]
-
-        # downloads 테이블에 기록
-        with get_db() as conn:
-            cursor = conn.cursor()
-            now = datetime.now().isoformat()
-
-            # 다운로드 상태 초기화
-            cursor.execute("""
-                INSERT INTO downloads (video_id, status, created_at, updated_at)
-                VALUES (?, 'running', ?, ?)
-            """, (video_id, now, now))
-            download_id = cursor.lastrowid
-            conn.commit()
-
-        # 실제 다운로드 수행
-        result = downloader.download_video(video_id, channel_title)
-
-        # 결과 업데이트
-        with get_db() as conn:
-            cursor = conn.cursor()
-            now = datetime.now().isoformat()
-
-            if result["success"]:
-                cursor.execute("""
-                    UPDATE downloads
-                    SET status = 'done',
-                        file_path = ?,
-                        updated_at = ?
-                    WHERE id = ?
-                """, (result["file_path"], now, download_id))
-                status = "done"
-                error = None
-            else:
-                cursor.execute("""
-                    UPDATE downloads
-                    SET status = 'failed',
-                        error_message = ?,
-                        updated_at = ?
-                    WHERE id = ?
-                """, (result["error_message"], now, download_id))
-                status = "failed"
-                error = result["error_message"]
-
-            conn.commit()
-
-        results.append({
-            "video_id": video_id,
-            "video_title": video_title,
-            "status": status,
-            "file_path": result.get("file_path"),
-            "error": error
-        })
-
-    success_count = len([r for r in results if r["status"] == "done"])
-    failed_count = len([r for r in results if r["status"] == "failed"])
+    # 영상 정보 일괄 조회 (채널명 가져오기)
+    with get_db() as conn:
+        cursor = conn.cursor()
+        placeholders = ",".join(["?" for _ in data.video_ids])
+        cursor.execute(f"""
+            SELECT v.video_id, v.title, c.title as channel_title
+            FROM videos v
+            LEFT JOIN channels c ON v.channel_id = c.channel_id
+            WHERE v.video_id IN ({placeholders})
+        """, data.video_ids)
+        video_rows = {}
+        for row in cursor:
+            video_rows.setdefault(row[0], row)
+
+    # 영상별 다운로드 (yt-dlp 프로세스를 병렬 실행)
+    # 같은 파일에 동시에 쓰지 않도록 중복 video_id는 한 번만 다운로드
+    unique_video_ids = list(dict.fromkeys(data.video_ids))
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_MAX_WORKERS) as executor:
+        unique_results = dict(zip(unique_video_ids, executor.map(
+            lambda video_id: _download_one(video_id, video_rows.get(video_id)),
+            unique_video_ids
+        )))
+
+    # 결과는 요청 순서대로
+    results = [unique_results[video_id] for video_id in data.video_ids]
+
+    # 상태별 개수 집계
+    status_counts = Counter(r["status"] for r in results)
 
     return {
         "total": len(results),
-        "success": success_count,
-        "failed": failed_count,
+        "success": status_counts["done"],
+        "failed": status_counts["failed"],
         "results": results
     }
 
@@ -144,8 +163,7 @@ def get_download_status(video_ids: str = ""):
             ORDER BY created_at DESC
         """, video_id_list)
 
-        rows = cursor.fetchall()
-        downloads = [Download.from_row(row).to_dict() for row in rows]
+        downloads = [Download.from_row(row).to_dict() for row in cursor]
 
         return {"downloads": downloads}
 
@@ -192,7 +210,6 @@ def get_download_history(limit: int = 100):
             LIMIT ?
         """, (limit,))
 
-        rows = cursor.fetchall()
-        downloads = [Download.from_row(row).to_dict() for row in rows]
+        downloads = [Download.from_row(row).to_dict() for row in cursor]
 
         return {"downloads": downloads, "total": len(downloads)}
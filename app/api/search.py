@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from datetime import datetime
 from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from ..db import get_db
 from ..models import Video
 from .youtube import YouTubeAPI, QuotaExceededException
@@ -9,6 +10,22 @@ from .channels import get_available_api_key, mark_api_key_quota_exceeded
 
 router = APIRouter(prefix="/api/search", tags=["search"])
 
+# 채널별 YouTube API 동시 호출 수
+FETCH_MAX_WORKERS = 8
+
+# 정렬 옵션 -> ORDER BY 절
+SORT_OPTIONS = {
+    "latest": "v.published_at DESC",
+    "oldest": "v.published_at ASC",
+    "views_desc": "v.view_count DESC",
+    "views_asc": "v.view_count ASC",
+    "likes_desc": "v.like_count DESC",
+    "likes_asc": "v.like_count ASC",
+    "comments_desc": "v.comment_count DESC",
+    "comments_asc": "v.comment_count ASC"
+}
+DEFAULT_SORT = SORT_OPTIONS["latest"]
+
 
 class SearchRequest(BaseModel):
     category_id: int
@@ -53,73 +70,62 @@ def search_videos(data: SearchRequest):
     all_videos = []
     errors = []
     fetched_video_ids = []  # 이번 검색에서 가져온 video_id 추적
+    now = datetime.now().isoformat()  # 이번 검색의 기준 시각
+
+    # YouTube API로 쇼츠 가져오기 (채널당 max_videos개, 채널별 병렬 호출)
+    with ThreadPoolExecutor(max_workers=min(FETCH_MAX_WORKERS, len(channels))) as executor:
+        futures = [
+            executor.submit(
+                youtube_api.get_channel_shorts,
+                channel_row[1],
+                max_results=data.max_videos
+            )
+            for channel_row in channels
+        ]
 
-    # 각 채널에서 max_videos 개수만큼 가져오기
-    for channel_row in channels:
-        db_channel_id = channel_row[0]
-        youtube_channel_id = channel_row[1]
+    # 채널 순서대로 결과를 DB에 저장
+    for channel_row, future in zip(channels, futures):
         channel_title = channel_row[2]
 
         try:
-            # YouTube API로 쇼츠 가져오기 (채널당 max_videos개)
-            shorts = youtube_api.get_channel_shorts(
-                youtube_channel_id,
-                max_results=data.max_videos
-            )
+            shorts = future.result()
 
             # DB에 upsert
             with get_db() as conn:
                 cursor = conn.cursor()
-                now = datetime.now().isoformat()
-
-                for video_data in shorts:
-                    # 이번 검색에서 가져온 video_id 기록
-                    fetched_video_ids.append(video_data["video_id"])
-
-                    # 기존 영상 확인
-                    cursor.execute("""
-                        SELECT id FROM videos WHERE video_id = ?
-                    """, (video_data["video_id"],))
-                    existing = cursor.fetchone()
-
-                    if existing:
-                        # UPDATE
-                        cursor.execute("""
-                            UPDATE videos
-                            SET view_count = ?,
-                                like_count = ?,
-                                comment_count = ?,
-                                updated_at = ?
-                            WHERE video_id = ?
-                        """, (
-                            video_data["view_count"],
-                            video_data["like_count"],
-                            video_data["comment_count"],
-                            now,
-                            video_data["video_id"]
-                        ))
-                    else:
-                        # INSERT
-                        cursor.execute("""
-                            INSERT INTO videos (
-                                channel_id, video_id, title, published_at,
-                                view_count, like_count, comment_count, thumbnail_url, duration_seconds,
-                                is_short, created_at, updated_at
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            video_data["channel_id"],
-                            video_data["video_id"],
-                            video_data["title"],
-                            video_data["published_at"],
-                            video_data["view_count"],
-                            video_data["like_count"],
-                            video_data["comment_count"],
-                            video_data["thumbnail_url"],
-                            video_data["duration_seconds"],
-                            video_data["is_short"],
-                            now,
-                            now
-                        ))
+
+                # 이번 검색에서 가져온 video_id 기록
+                fetched_video_ids.extend(video_data["video_id"] for video_data in shorts)
+
+                # 없으면 INSERT, 있으면 통계만 UPDATE (일괄)
+                cursor.executemany("""
+                    INSERT INTO videos (
+                        channel_id, video_id, title, published_at,
+                        view_count, like_count, comment_count, thumbnail_url, duration_seconds,
+                        is_short, created_at, updated_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(video_id) DO UPDATE SET
+                        view_count = excluded.view_count,
+                        like_count = excluded.like_count,
+                        comment_count = excluded.comment_count,
+                        updated_at = excluded.updated_at
+                """, [
+                    (
+                        video_data["channel_id"],
+                        video_data["video_id"],
+                        video_data["title"],
+                        video_data["published_at"],
+                        video_data["view_count"],
+                        video_data["like_count"],
+                        video_data["comment_count"],
+                        video_data["thumbnail_url"],
+                        video_data["duration_seconds"],
+                        video_data["is_short"],
+                        now,
+                        now
+                    )
+                    for video_data in shorts
+                ])
 
                 conn.commit()
 
@@ -155,17 +161,7 @@ def search_videos(data: SearchRequest):
         min_views = data.min_views_man * 10000
 
         # 정렬 조건
-        sort_options = {
-            "latest": "v.published_at DESC",
-            "oldest": "v.published_at ASC",
-            "views_desc": "v.view_count DESC",
-            "views_asc": "v.view_count ASC",
-            "likes_desc": "v.like_count DESC",
-            "likes_asc": "v.like_count ASC",
-            "comments_desc": "v.comment_count DESC",
-            "comments_asc": "v.comment_count ASC"
-        }
-        order_by = sort_options.get(data.sort, "v.published_at DESC")
+        order_by = SORT_OPTIONS.get(data.sort, DEFAULT_SORT)
 
         # 이번 검색에서 가져온 영상만 조회
         placeholders = ','.join('?' * len(fetched_video_ids))
@@ -181,8 +177,8 @@ def search_videos(data: SearchRequest):
             ORDER BY {order_by}
         """, (*fetched_video_ids, min_views))
 
-        rows = cursor.fetchall()
-        videos = [Video.from_row(row).to_dict() for row in rows]
+        # 커서에서 바로 변환 (중간 리스트 없이)
+        videos = [Video.from_row(row).to_dict() for row in cursor]
 
     return {
         "videos": videos,
@@ -208,17 +204,7 @@ def get_videos(
         min_views = min_views_man * 10000
 
         # 정렬 조건
-        sort_options = {
-            "latest": "v.published_at DESC",
-            "oldest": "v.published_at ASC",
-            "views_desc": "v.view_count DESC",
-            "views_asc": "v.view_count ASC",
-            "likes_desc": "v.like_count DESC",
-            "likes_asc": "v.like_count ASC",
-            "comments_desc": "v.comment_count DESC",
-            "comments_asc": "v.comment_count ASC"
-        }
-        order_by = sort_options.get(sort, "v.published_at DESC")
+        order_by = SORT_OPTIONS.get(sort, DEFAULT_SORT)
 
         if category_id:
             cursor.execute(f"""
@@ -245,7 +231,7 @@ def get_videos(
                 ORDER BY {order_by}
             """, (min_views,))
 
-        rows = cursor.fetchall()
-        videos = [Video.from_row(row).to_dict() for row in rows]
+        # 커서에서 바로 변환 (중간 리스트 없이)
+        videos = [Video.from_row(row).to_dict() for row in cursor]
 
         return {"videos": videos, "total": len(videos)}
@@ -1,10 +1,30 @@
 import re
 import requests
-from typing import Optional, Dict, List, Tuple
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, List, Tuple, Iterator
 from datetime import datetime
 import isodate
 
 
+# 프로세스 전체에서 공유하는 HTTP 세션 (연결/TLS 재사용)
+# 채널별 병렬 호출을 수용할 만큼 풀 크기 확보
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_maxsize=32))
+
+# 채널 입력 정규화용 정규식 (모듈 로드 시 1회 컴파일)
+CHANNEL_ID_RE = re.compile(r"^UC[\w-]{22}$")
+HANDLE_RE = re.compile(r"@([\w-]+)")
+CHANNEL_PATH_RE = re.compile(r"/channel/(UC[\w-]{22})")
+CUSTOM_PATH_RE = re.compile(r"/c/([\w-]+)")
+USER_PATH_RE = re.compile(r"/user/([\w-]+)")
+
+# 채널 ID -> 업로드 플레이리스트 ID (변하지 않는 값이므로 프로세스 단위로 캐시)
+_uploads_playlist_cache: Dict[str, str] = {}
+
+# 핸들/커스텀 URL/사용자명 -> 채널 ID (search 호출은 쿼터 100 단위이므로 결과 재사용)
+_channel_id_cache: Dict[str, str] = {}
+
+
 class QuotaExceededException(Exception):
     """YouTube API 쿼터 초과 예외"""
     pass
@@ -17,12 +37,14 @@ class YouTubeAPI:
 
     def __init__(self, api_key: str):
         self.api_key = api_key
+        # 요청 단위 채널 정보 캐시 (같은 채널 중복 조회 방지)
+        self._channel_info_cache: Dict[str, Dict] = {}
 
     def _request(self, endpoint: str, params: dict) -> dict:
         """API 요청 헬퍼"""
         params["key"] = self.api_key
         url = f"{self.BASE_URL}/{endpoint}"
-        response = requests.get(url, params=params, timeout=30)
+        response = _session.get(url, params=params, timeout=30)
 
         # 쿼터 초과 에러 체크
         if response.status_code == 403:
@@ -49,35 +71,46 @@ class YouTubeAPI:
         channel_input = channel_input.strip()
 
         # 이미 channelId 형식인 경우 (UC로 시작하는 24자)
-        if re.match(r"^UC[\w-]{22}$", channel_input):
+        if CHANNEL_ID_RE.match(channel_input):
             return channel_input
 
         # URL에서 채널 정보 추출
         # @handle 형식
-        handle_match = re.search(r"@([\w-]+)", channel_input)
+        handle_match = HANDLE_RE.search(channel_input)
         if handle_match:
             handle = handle_match.group(1)
-            return self._resolve_handle_to_channel_id(handle)
+            return self._resolve_cached("handle", handle, self._resolve_handle_to_channel_id)
 
         # /channel/UCxxxx 형식
-        channel_match = re.search(r"/channel/(UC[\w-]{22})", channel_input)
+        channel_match = CHANNEL_PATH_RE.search(channel_input)
         if channel_match:
             return channel_match.group(1)
 
         # /c/CustomName 형식
-        custom_match = re.search(r"/c/([\w-]+)", channel_input)
+        custom_match = CUSTOM_PATH_RE.search(channel_input)
         if custom_match:
             custom_name = custom_match.group(1)
-            return self._resolve_custom_url_to_channel_id(custom_name)
+            return self._resolve_cached("custom", custom_name, self._resolve_custom_url_to_channel_id)
 
         # /user/username 형식
-        user_match = re.search(r"/user/([\w-]+)", channel_input)
+        user_match = USER_PATH_RE.search(channel_input)
         if user_match:
             username = user_match.group(1)
-            return self._resolve_username_to_channel_id(username)
+            return self._resolve_cached("user", username, self._resolve_username_to_channel_id)
 
         return None
 
+    def _resolve_cached(self, kind: str, name: str, resolver) -> Optional[str]:
+        """channelId 변환 결과 캐시 (성공한 결과만 프로세스 단위로 보관)"""
+        key = f"{kind}:{name}"
+        if key in _channel_id_cache:
+            return _channel_id_cache[key]
+
+        channel_id = resolver(name)
+        if channel_id:
+            _channel_id_cache[key] = channel_id
+        return channel_id
+
     def _resolve_handle_to_channel_id(self, handle: str) -> Optional[str]:
         """핸들(@handle)을 channelId로 변환"""
         try:
@@ -124,8 +157,26 @@ class YouTubeAPI:
             pass
         return None
 
+    @staticmethod
+    def _parse_channel_item(item: Dict) -> Dict:
+        """channels API 응답 항목 -> 채널 정보 dict"""
+        snippet = item.get("snippet", {})
+        statistics = item.get("statistics", {})
+
+        return {
+            "channel_id": item["id"],
+            "title": snippet.get("title"),
+            "description": snippet.get("description"),
+            "subscriber_count": int(statistics.get("subscriberCount", 0)),
+            "country": snippet.get("country"),
+            "thumbnail": snippet.get("thumbnails", {}).get("default", {}).get("url")
+        }
+
     def get_channel_info(self, channel_id: str) -> Optional[Dict]:
         """채널 정보 가져오기"""
+        if channel_id in self._channel_info_cache:
+            return self._channel_info_cache[channel_id]
+
         try:
             result = self._request("channels", {
                 "part": "snippet,statistics",
@@ -135,24 +186,61 @@ class YouTubeAPI:
             if not result.get("items"):
                 return None
 
-            item = result["items"][0]
-            snippet = item.get("snippet", {})
-            statistics = item.get("statistics", {})
-
-            return {
-                "channel_id": channel_id,
-                "title": snippet.get("title"),
-                "description": snippet.get("description"),
-                "subscriber_count": int(statistics.get("subscriberCount", 0)),
-                "country": snippet.get("country"),
-                "thumbnail": snippet.get("thumbnails", {}).get("default", {}).get("url")
-            }
+            channel_info = self._parse_channel_item(result["items"][0])
+            self._channel_info_cache[channel_id] = channel_info
+            return channel_info
         except Exception as e:
             print(f"Error getting channel info: {e}")
             return None
 
+    def get_channels_info(self, channel_ids: List[str]) -> Tuple[Dict[str, Dict], List[str]]:
+        """
+        여러 채널 정보 일괄 가져오기 (최대 50개씩 묶어서 요청)
+
+        쿼터 초과 시 남은 배치는 요청하지 않고 그때까지 조회한 결과만 반환
+
+        반환: (channelId -> 채널 정보, 쿼터 초과로 조회하지 못한 channelId 목록)
+        조회했지만 찾지 못한 채널은 어느 쪽에도 포함하지 않음
+        """
+        missing = [
+            cid for cid in dict.fromkeys(channel_ids)
+            if cid not in self._channel_info_cache
+        ]
+
+        unprocessed = []
+
+        # YouTube API는 한 번에 최대 50개까지만 조회 가능
+        for i in range(0, len(missing), 50):
+            batch = missing[i:i + 50]
+            try:
+                result = self._request("channels", {
+                    "part": "snippet,statistics",
+                    "id": ",".join(batch),
+                    "maxResults": 50
+                })
+
+                for item in result.get("items", []):
+                    channel_info = self._parse_channel_item(item)
+                    self._channel_info_cache[channel_info["channel_id"]] = channel_info
+            except QuotaExceededException as e:
+                print(f"Error getting channels info: {e}")
+                unprocessed = missing[i:]
+                break
+            except Exception as e:
+                print(f"Error getting channels info: {e}")
+
+        channel_infos = {
+            cid: self._channel_info_cache[cid]
+            for cid in channel_ids
+            if cid in self._channel_info_cache
+        }
+        return channel_infos, unprocessed
+
     def get_channel_uploads_playlist_id(self, channel_id: str) -> Optional[str]:
         """채널의 업로드 플레이리스트 ID 가져오기"""
+        if channel_id in _uploads_playlist_cache:
+            return _uploads_playlist_cache[channel_id]
+
         try:
             result = self._request("channels", {
                 "part": "contentDetails",
@@ -160,35 +248,38 @@ class YouTubeAPI:
             })
 
             if result.get("items"):
-                return result["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
+                playlist_id = result["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
+                _uploads_playlist_cache[channel_id] = playlist_id
+                return playlist_id
         except Exception:
             pass
         return None
 
-    def get_videos_from_playlist(
+    def iter_playlist_pages(
         self,
         playlist_id: str,
         max_results: int = 50
-    ) -> List[str]:
-        """플레이리스트에서 비디오 ID 목록 가져오기"""
-        video_ids = []
+    ) -> Iterator[List[str]]:
+        """플레이리스트의 비디오 ID를 페이지(최대 50개) 단위로 순차 반환"""
+        fetched = 0
         page_token = None
 
         try:
-            while len(video_ids) < max_results:
+            while fetched < max_results:
                 params = {
                     "part": "contentDetails",
                     "playlistId": playlist_id,
-                    "maxResults": min(50, max_results - len(video_ids))
+                    "maxResults": min(50, max_results - fetched)
                 }
                 if page_token:
                     params["pageToken"] = page_token
 
                 result = self._request("playlistItems", params)
 
-                for item in result.get("items", []):
-                    video_id = item["contentDetails"]["videoId"]
-                    video_ids.append(video_id)
+                page = [item["contentDetails"]["videoId"] for item in result.get("items", [])]
+                fetched += len(page)
+                if page:
+                    yield page
 
                 page_token = result.get("nextPageToken")
                 if not page_token:
@@ -197,8 +288,6 @@ class YouTubeAPI:
         except Exception as e:
             print(f"Error getting videos from playlist: {e}")
 
-        return video_ids
-
     def get_video_details(self, video_ids: List[str]) -> List[Dict]:
         """비디오 상세 정보 가져오기 (최대 50개씩)"""
         all_videos = []
@@ -268,22 +357,16 @@ class YouTubeAPI:
         if not uploads_playlist_id:
             return []
 
-        # 최근 영상 ID 목록 가져오기 (쇼츠 필터링을 위해 충분히 많이 가져옴)
-        # 일반 영상과 쇼츠가 섞여있으므로 5배로 가져와서 안전하게 확보
+        # 최근 영상 ID를 페이지 단위로 가져오며 쇼츠만 모으기
+        # 일반 영상과 쇼츠가 섞여있으므로 최대 5배(200개)까지 확인하되,
+        # max_results개를 채우면 남은 페이지는 요청하지 않음
         fetch_count = min(max_results * 5, 200)  # 최대 200개까지만
-        video_ids = self.get_videos_from_playlist(
-            uploads_playlist_id,
-            max_results=fetch_count
-        )
-
-        if not video_ids:
-            return []
-
-        # 비디오 상세 정보 가져오기
-        videos = self.get_video_details(video_ids)
-
-        # 쇼츠만 필터링
-        shorts = [v for v in videos if v["is_short"] == 1]
+        shorts = []
+        for page in self.iter_playlist_pages(uploads_playlist_id, max_results=fetch_count):
+            videos = self.get_video_details(page)
+            shorts.extend(v for v in videos if v["is_short"] == 1)
+            if len(shorts) >= max_results:
+                break
 
         # max_results만큼만 반환
         return shorts[:max_results]
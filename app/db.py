@@ -11,8 +11,18 @@ def get_db():
     """데이터베이스 연결 컨텍스트 매니저"""
     conn = sqlite3.connect(DATABASE_PATH)
     conn.row_factory = sqlite3.Row
+    # WAL 모드에서는 NORMAL로도 손상 없이 안전 (OS 크래시 시 마지막 트랜잭션만 유실 가능)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
     try:
         yield conn
+        # 단기 연결은 닫기 직전 실행이 SQLite 권장 방식
+        # (이 연결의 쿼리가 사용한 테이블 중 통계가 필요한 것만 ANALYZE)
+        # 통계 갱신은 부가 작업이므로 실패(잠금 등)해도 요청은 실패시키지 않음
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
     finally:
         conn.close()
 
@@ -22,6 +32,9 @@ def init_db():
     with get_db() as conn:
         cursor = conn.cursor()
 
+        # WAL 모드 (DB 파일에 영구 적용, 읽기와 쓰기 동시 진행 가능)
+        cursor.execute("PRAGMA journal_mode=WAL")
+
         # categories 테이블
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS categories (
@@ -165,6 +178,18 @@ def init_db():
 
         conn.commit()
 
+        # 시작 시 쿼리 플래너 통계 갱신 (인덱스당 표본 제한으로 대용량 DB에서도 빠르게)
+        # PRAGMA optimize는 통계가 없는 테이블은 분석하지 않으므로 여기서 기준 통계 확보,
+        # 이후 실행 중 변경분은 get_db()의 PRAGMA optimize가 갱신
+        cursor.execute("PRAGMA analysis_limit=1000")
+        cursor.execute("ANALYZE")
+
+
+def close_db():
+    """앱 종료 시 WAL 정리"""
+    with get_db() as conn:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
 
 def reset_db():
     """데이터베이스 초기화 (테스트용)"""
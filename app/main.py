@@ -2,7 +2,7 @@ from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
-from .db import init_db, get_db
+from .db import init_db, close_db, get_db
 from .api import (
     categories_router,
     channels_router,
@@ -35,6 +35,12 @@ def startup_event():
     print("Database initialized")
 
 
+@app.on_event("shutdown")
+def shutdown_event():
+    """앱 종료 시 DB 정리"""
+    close_db()
+
+
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """메인 페이지"""
@@ -42,19 +48,23 @@ async def index(request: Request):
     with get_db() as conn:
         cursor = conn.cursor()
 
-        # 전체 채널 개수
-        cursor.execute("SELECT COUNT(*) FROM channels")
-        total_count = cursor.fetchone()[0]
-
-        # 각 카테고리별 채널 개수 포함 (display_order로 정렬)
+        # 각 카테고리별 채널 개수와 전체 채널 개수를 한 번에 조회 (display_order로 정렬)
         cursor.execute("""
-            SELECT c.id, c.name, c.created_at, c.display_order, COUNT(ch.id) as channel_count
+            SELECT c.id, c.name, c.created_at, c.display_order, COUNT(ch.id) as channel_count,
+                   (SELECT COUNT(*) FROM channels) as total_count
             FROM categories c
             LEFT JOIN channels ch ON c.id = ch.category_id
             GROUP BY c.id, c.name, c.created_at, c.display_order
             ORDER BY c.display_order ASC, c.id ASC
         """)
         category_rows = cursor.fetchall()
+
+        # 전체 채널 개수
+        if category_rows:
+            total_count = category_rows[0][5]
+        else:
+            cursor.execute("SELECT COUNT(*) FROM channels")
+            total_count = cursor.fetchone()[0]
         categories = [
             {
                 "id": row[0],
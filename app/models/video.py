@@ -2,9 +2,50 @@ from datetime import datetime
 from typing import Optional
 
 
+class _LazyDatetime:
+    """
+    DB의 ISO 문자열을 첫 접근 시에만 datetime으로 변환하는 속성
+
+    변환 결과는 별도 속성에 캐시하고 원본 문자열은 그대로 두므로
+    to_dict() 결과는 접근 여부와 무관하게 동일
+    """
+
+    def __set_name__(self, owner, name):
+        self.attr = "_" + name
+        self.parsed_attr = "_" + name + "_parsed"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.attr)
+        if not isinstance(value, str):
+            return value
+        if self.parsed_attr not in obj.__dict__:
+            obj.__dict__[self.parsed_attr] = datetime.fromisoformat(value) if value else None
+        return obj.__dict__[self.parsed_attr]
+
+    def __set__(self, obj, value):
+        setattr(obj, self.attr, value)
+        # 값이 바뀌면 이전 변환 결과는 버림
+        obj.__dict__.pop(self.parsed_attr, None)
+
+
+def _to_iso(value) -> Optional[str]:
+    """datetime 또는 파싱 전 문자열을 ISO 문자열로 변환"""
+    if not value:
+        return None
+    if isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
 class Video:
     """비디오 모델"""
 
+    published_at = _LazyDatetime()
+    created_at = _LazyDatetime()
+    updated_at = _LazyDatetime()
+
     def __init__(
         self,
         id: Optional[int] = None,
@@ -38,26 +79,27 @@ class Video:
         self.channel_title = channel_title
 
     def to_dict(self):
+        # 날짜 필드는 파싱하지 않은 DB 문자열을 그대로 사용
         return {
             "id": self.id,
             "channel_id": self.channel_id,
             "video_id": self.video_id,
             "title": self.title,
-            "published_at": self.published_at.isoformat() if self.published_at else None,
+            "published_at": _to_iso(self._published_at),
             "view_count": self.view_count,
             "like_count": self.like_count,
             "comment_count": self.comment_count,
             "thumbnail_url": self.thumbnail_url,
             "duration_seconds": self.duration_seconds,
             "is_short": self.is_short,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": _to_iso(self._created_at),
+            "updated_at": _to_iso(self._updated_at),
             "channel_title": self.channel_title
         }
 
     @classmethod
     def from_row(cls, row):
-        """SQLite row를 Video 객체로 변환"""
+        """SQLite row를 Video 객체로 변환 (날짜는 접근 시 파싱)"""
         if not row:
             return None
 
@@ -67,14 +109,14 @@ class Video:
             channel_id=row[1],
             video_id=row[2],
             title=row[3],
-            published_at=datetime.fromisoformat(row[4]) if row[4] else None,
+            published_at=row[4] or None,
             view_count=row[5],
             like_count=row[6] if len(row) > 6 else 0,
             comment_count=row[7] if len(row) > 7 else 0,
             thumbnail_url=row[8] if len(row) > 8 else None,
             duration_seconds=row[9] if len(row) > 9 else None,
             is_short=row[10] if len(row) > 10 else 1,
-            created_at=datetime.fromisoformat(row[11]) if len(row) > 11 and row[11] else None,
-            updated_at=datetime.fromisoformat(row[12]) if len(row) > 12 and row[12] else None,
+            created_at=row[11] if len(row) > 11 and row[11] else None,
+            updated_at=row[12] if len(row) > 12 and row[12] else None,
             channel_title=row[13] if len(row) > 13 else None
         )